@@ -26,3 +26,7 @@ def generate_policy(request: PromptRequest):
     )
     
     return PolicyResponse(policy=policy, summary=summary)
+
+@router.get("/metrics")
+def get_llm_metrics():
+    return llm_service.metrics()
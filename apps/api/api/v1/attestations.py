@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends
 from models import AttestationRequest, AttestationResponse, Evidence
 from models_db import AuditLog, Policy
 from database import get_db
@@ -68,11 +68,8 @@ async def create_attestation(request: AttestationRequest, db: Session = Depends(
         decision = "STEP_UP"
         reason_codes.append("GPS_LOW_ACCURACY")
     
-    # Use LLM Service for explanation
-    try:
-        explanation = llm_service.explain_decision(decision, reason_codes, evidence_data)
-    except RuntimeError as exc:
-        raise HTTPException(status_code=503, detail=str(exc)) from exc
+    # Use LLM Service for explanation (degrades to reason-code templates on failure)
+    explanation = llm_service.explain_decision(decision, reason_codes, evidence_data)
     
     attestation_id = str(uuid.uuid4())
     
@@ -0,0 +1,188 @@
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, NamedTuple
+
+
+def env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class Permit(NamedTuple):
+    """Issued by ``CircuitBreaker.acquire``; identifies the cycle that admitted a call."""
+    cycle: int
+    probe: bool
+
+
+class CircuitBreaker:
+    """
+    Rolling-window circuit breaker.
+
+    Errors and calls slower than ``latency_threshold_s`` both count as failures.
+    Once ``failure_threshold`` failures land inside ``window_s`` the circuit opens
+    and rejects calls for ``reset_timeout_s``. It then goes half-open and lets up to
+    ``half_open_max_calls`` probes through: one success closes it, one failure
+    re-opens it. Results of calls admitted before the circuit last changed state
+    only update the counters.
+    """
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        window_s: float = 60.0,
+        latency_threshold_s: float = 3.0,
+        reset_timeout_s: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.window_s = window_s
+        self.latency_threshold_s = latency_threshold_s
+        self.reset_timeout_s = reset_timeout_s
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._cycle = 0
+        self._failures: deque[float] = deque()
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._counters = {
+            "calls": 0,
+            "successes": 0,
+            "errors": 0,
+            "slow_calls": 0,
+            "rejected": 0,
+            "opened": 0,
+        }
+
+    @classmethod
+    def from_env(cls, name: str, prefix: str, latency_threshold_s: float = 3.0) -> "CircuitBreaker":
+        return cls(
+            name=name,
+            failure_threshold=env_int(f"{prefix}_FAILURE_THRESHOLD", 5),
+            window_s=env_float(f"{prefix}_WINDOW_SECONDS", 60.0),
+            latency_threshold_s=env_float(f"{prefix}_LATENCY_THRESHOLD_SECONDS", latency_threshold_s),
+            reset_timeout_s=env_float(f"{prefix}_RESET_TIMEOUT_SECONDS", 30.0),
+            half_open_max_calls=env_int(f"{prefix}_HALF_OPEN_MAX_CALLS", 1),
+        )
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open(self.clock())
+            return self._state
+
+    def _maybe_half_open(self, now: float) -> None:
+        if self._state == self.OPEN and now - self._opened_at >= self.reset_timeout_s:
+            self._state = self.HALF_OPEN
+            self._cycle += 1
+            self._half_open_in_flight = 0
+
+    def _open(self, now: float) -> None:
+        self._state = self.OPEN
+        self._cycle += 1
+        self._opened_at = now
+        self._half_open_in_flight = 0
+        self._failures.clear()
+        self._counters["opened"] += 1
+
+    def _close(self) -> None:
+        self._state = self.CLOSED
+        self._cycle += 1
+        self._half_open_in_flight = 0
+        self._failures.clear()
+
+    def _prune(self, now: float) -> None:
+        while self._failures and now - self._failures[0] > self.window_s:
+            self._failures.popleft()
+
+    def acquire(self) -> Permit:
+        """Reserve a call slot, raising ``CircuitOpenError`` if the circuit rejects it."""
+        with self._lock:
+            self._maybe_half_open(self.clock())
+            if self._state == self.OPEN or (
+                self._state == self.HALF_OPEN and self._half_open_in_flight >= self.half_open_max_calls
+            ):
+                self._counters["rejected"] += 1
+                raise CircuitOpenError(f"Circuit '{self.name}' is open; call rejected.")
+            probe = self._state == self.HALF_OPEN
+            if probe:
+                self._half_open_in_flight += 1
+            self._counters["calls"] += 1
+            return Permit(cycle=self._cycle, probe=probe)
+
+    def release(self, permit: Permit) -> None:
+        """Give back a permit whose call ended without a result worth recording."""
+        with self._lock:
+            if permit.probe and permit.cycle == self._cycle:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+    def record(self, permit: Permit, elapsed_s: float, error: bool) -> None:
+        """Record the outcome of a call previously admitted by ``acquire``."""
+        slow = not error and elapsed_s > self.latency_threshold_s
+        with self._lock:
+            now = self.clock()
+            if error:
+                self._counters["errors"] += 1
+            elif slow:
+                self._counters["slow_calls"] += 1
+            else:
+                self._counters["successes"] += 1
+
+            if permit.cycle != self._cycle:
+                return
+
+            if permit.probe:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                if error or slow:
+                    self._open(now)
+                else:
+                    self._close()
+                return
+
+            if not (error or slow):
+                return
+            self._failures.append(now)
+            self._prune(now)
+            if len(self._failures) >= self.failure_threshold:
+                self._open(now)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            now = self.clock()
+            self._maybe_half_open(now)
+            self._prune(now)
+            return {
+                "name": self.name,
+                "state": self._state,
+                "failure_threshold": self.failure_threshold,
+                "window_seconds": self.window_s,
+                "latency_threshold_seconds": self.latency_threshold_s,
+                "reset_timeout_seconds": self.reset_timeout_s,
+                "half_open_max_calls": self.half_open_max_calls,
+                "recent_failures": len(self._failures),
+                **self._counters,
+            }
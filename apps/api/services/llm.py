@@ -1,12 +1,41 @@
 import os
 import json
+import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from pathlib import Path
 
+from services.circuit_breaker import CircuitBreaker, CircuitOpenError, env_float
+
 try:
-    from openai import OpenAI
+    from openai import OpenAI, APIError, APITimeoutError
 except ImportError:
     OpenAI = None
+    APIError = None
+    APITimeoutError = None
+
+logger = logging.getLogger(__name__)
+
+# Deterministic explanations used when the LLM is unavailable or over budget.
+REASON_CODE_TEMPLATES = {
+    "COUNTRY_MATCH": "Your location is in a permitted region.",
+    "COUNTRY_DENIED": "Access is not available from your current region.",
+    "COUNTRY_NOT_ALLOWED": "Your current region is not on the list of permitted regions.",
+    "GPS_LOW_ACCURACY": "Your location could not be confirmed precisely enough, so additional verification is required.",
+}
+
+DECISION_TEMPLATES = {
+    "ALLOW": "Your location was verified successfully.",
+    "STEP_UP": "We need a little more information to verify your location.",
+    "DENY": "Access was denied based on your location.",
+}
+
+class LLMNotConfiguredError(RuntimeError):
+    """Raised when the openai package or API key is unavailable."""
+
+class LLMBudgetExceededError(RuntimeError):
+    """Raised when an LLM call does not finish within its latency budget."""
 
 class LLMService:
     def __init__(self):
@@ -14,6 +43,24 @@ class LLMService:
         self.api_key = self._resolve_api_key()
         if self.api_key and OpenAI:
             self.client = OpenAI(api_key=self.api_key)
+        self.explain_budget_s = env_float("LLM_EXPLAIN_BUDGET_SECONDS", 2.0)
+        self.policy_budget_s = env_float("LLM_POLICY_BUDGET_SECONDS", 20.0)
+        self.explain_breaker = CircuitBreaker.from_env("explain", "LLM_EXPLAIN_BREAKER", latency_threshold_s=1.5)
+        self.policy_breaker = CircuitBreaker.from_env("policy", "LLM_POLICY_BREAKER", latency_threshold_s=15.0)
+        for name, breaker, budget_s in (
+            ("EXPLAIN", self.explain_breaker, self.explain_budget_s),
+            ("POLICY", self.policy_breaker, self.policy_budget_s),
+        ):
+            if breaker.latency_threshold_s > budget_s:
+                logger.warning(
+                    "LLM_%s_BREAKER_LATENCY_THRESHOLD_SECONDS (%s) exceeds LLM_%s_BUDGET_SECONDS (%s); "
+                    "clamping it to the budget.",
+                    name, breaker.latency_threshold_s, name, budget_s,
+                )
+                breaker.latency_threshold_s = budget_s
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm")
+        self._metrics_lock = threading.Lock()
+        self._degraded = {"circuit_open": 0, "budget_exceeded": 0, "unconfigured": 0, "error": 0}
 
     def _resolve_api_key(self) -> str | None:
         api_key = os.getenv("OPENAI_API_KEY")
@@ -39,18 +86,66 @@ class LLMService:
 
     def _ensure_client(self) -> OpenAI:
         if OpenAI is None:
-            raise RuntimeError("openai package is not installed in the API environment.")
+            raise LLMNotConfiguredError("openai package is not installed in the API environment.")
         if not self.api_key:
-            raise RuntimeError("OPENAI_API_KEY is missing. Set it in apps/api/.env or your shell environment.")
+            raise LLMNotConfiguredError("OPENAI_API_KEY is missing. Set it in apps/api/.env or your shell environment.")
         if self.client is None:
             self.client = OpenAI(api_key=self.api_key)
         return self.client
 
+    def _create_completion(self, breaker: CircuitBreaker, budget_s: float, client, **request):
+        """
+        Sends a chat completion through ``breaker`` under a wall-clock deadline of
+        ``budget_s``, covering SDK retries. Only OpenAI API errors and overruns
+        count as breaker failures.
+        """
+        permit = breaker.acquire()
+        started = breaker.clock()
+        future = self._executor.submit(client.chat.completions.create, **request)
+        try:
+            response = future.result(timeout=budget_s)
+        except FuturesTimeoutError as exc:
+            future.cancel()
+            breaker.record(permit, breaker.clock() - started, error=True)
+            raise LLMBudgetExceededError(f"OpenAI call exceeded its {budget_s}s latency budget.") from exc
+        except Exception as exc:
+            if APIError is not None and isinstance(exc, APIError):
+                breaker.record(permit, breaker.clock() - started, error=True)
+            else:
+                breaker.release(permit)
+            raise
+        elapsed_s = breaker.clock() - started
+        if elapsed_s > budget_s:
+            breaker.record(permit, elapsed_s, error=True)
+            raise LLMBudgetExceededError(f"OpenAI call exceeded its {budget_s}s latency budget.")
+        breaker.record(permit, elapsed_s, error=False)
+        return response
+
+    def _count_degraded(self, reason: str) -> None:
+        with self._metrics_lock:
+            self._degraded[reason] += 1
+
+    def metrics(self) -> dict:
+        with self._metrics_lock:
+            degraded = dict(self._degraded)
+        return {
+            "circuit_breakers": {
+                "explain": self.explain_breaker.snapshot(),
+                "policy": self.policy_breaker.snapshot(),
+            },
+            "degraded_responses": {"total": sum(degraded.values()), **degraded},
+            "explain_budget_seconds": self.explain_budget_s,
+            "policy_budget_seconds": self.policy_budget_s,
+        }
+
     def generate_policy(self, prompt: str) -> dict:
         """
         Generates a policy JSON from a natural language prompt.
         """
-        return self._generate_real(prompt)
+        try:
+            return self._generate_real(prompt)
+        except CircuitOpenError as exc:
+            raise RuntimeError(f"OpenAI policy generation unavailable: {exc}") from exc
 
     def _extract_country_codes(self, prompt: str, verbs: tuple[str, ...]) -> list[str]:
         if not prompt:
@@ -144,8 +239,11 @@ class LLMService:
 
     def _generate_real(self, prompt: str) -> dict:
         try:
-            client = self._ensure_client()
-            response = client.chat.completions.create(
+            client = self._ensure_client().with_options(timeout=self.policy_budget_s)
+            response = self._create_completion(
+                self.policy_breaker,
+                self.policy_budget_s,
+                client,
                 model="gpt-4o-mini",
                 response_format={"type": "json_object"},
                 messages=[
@@ -170,19 +268,49 @@ class LLMService:
             if not content:
                 raise RuntimeError("OpenAI returned an empty response for policy generation.")
             return self._normalize_policy(json.loads(content), prompt)
+        except (CircuitOpenError, LLMNotConfiguredError, LLMBudgetExceededError):
+            raise
         except Exception as e:
             raise RuntimeError(f"OpenAI policy generation failed: {e}") from e
 
     def explain_decision(self, decision: str, reason_codes: list, evidence: dict) -> str:
         """
         Generates a user-friendly explanation for the decision.
+
+        Falls back to deterministic reason-code templates when the circuit is open,
+        the latency budget is exceeded, the LLM is not configured or the call
+        fails, so access decisions never depend on OpenAI availability.
         """
-        return self._explain_real(decision, reason_codes, evidence)
+        try:
+            return self._explain_real(decision, reason_codes, evidence)
+        except CircuitOpenError:
+            self._count_degraded("circuit_open")
+        except LLMNotConfiguredError:
+            self._count_degraded("unconfigured")
+        except LLMBudgetExceededError:
+            self._count_degraded("budget_exceeded")
+        except RuntimeError as exc:
+            if APITimeoutError is not None and isinstance(exc.__cause__, APITimeoutError):
+                self._count_degraded("budget_exceeded")
+            else:
+                self._count_degraded("error")
+        return self.explain_from_templates(decision, reason_codes)
+
+    def explain_from_templates(self, decision: str, reason_codes: list) -> str:
+        sentences = [DECISION_TEMPLATES.get(decision, DECISION_TEMPLATES["STEP_UP"])]
+        for code in reason_codes:
+            template = REASON_CODE_TEMPLATES.get(code)
+            if template and template not in sentences:
+                sentences.append(template)
+        return " ".join(sentences)
 
     def _explain_real(self, decision: str, reason_codes: list, evidence: dict) -> str:
         try:
-            client = self._ensure_client()
-            response = client.chat.completions.create(
+            client = self._ensure_client().with_options(timeout=self.explain_budget_s, max_retries=0)
+            response = self._create_completion(
+                self.explain_breaker,
+                self.explain_budget_s,
+                client,
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "You are GeoLogic. Explain the access decision to the user in a short, friendly, helpful sentence. Do not mention JSON fields directly."},
@@ -193,6 +321,8 @@ class LLMService:
             if not content:
                 raise RuntimeError("OpenAI returned an empty response for explanation.")
             return content
+        except (CircuitOpenError, LLMNotConfiguredError, LLMBudgetExceededError):
+            raise
         except Exception as e:
             raise RuntimeError(f"OpenAI explanation failed: {e}") from e
 
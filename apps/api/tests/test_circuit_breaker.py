@@ -0,0 +1,100 @@
+import pytest
+
+from services.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_breaker(clock, **overrides):
+    options = {
+        "failure_threshold": 2,
+        "window_s": 10.0,
+        "latency_threshold_s": 1.0,
+        "reset_timeout_s": 5.0,
+        "half_open_max_calls": 1,
+    }
+    options.update(overrides)
+    return CircuitBreaker("test", clock=clock, **options)
+
+
+def fail(breaker, elapsed_s=0.1):
+    breaker.record(breaker.acquire(), elapsed_s, error=True)
+
+
+def test_opens_after_failures_in_window_and_rejects():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    fail(breaker)
+    assert breaker.state == CircuitBreaker.CLOSED
+    fail(breaker)
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+    assert breaker.snapshot()["rejected"] == 1
+
+
+def test_failures_outside_window_do_not_open():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    fail(breaker)
+    clock.now = 11.0
+    assert breaker.snapshot()["recent_failures"] == 0
+    fail(breaker)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_slow_calls_count_as_failures():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    breaker.record(breaker.acquire(), 1.5, error=False)
+    breaker.record(breaker.acquire(), 1.5, error=False)
+    snapshot = breaker.snapshot()
+    assert snapshot["state"] == CircuitBreaker.OPEN
+    assert snapshot["slow_calls"] == 2
+
+
+def test_half_open_probe_limit_and_close_on_success():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    fail(breaker)
+    fail(breaker)
+    clock.now = 5.0
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    probe = breaker.acquire()
+    assert probe.probe
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+    breaker.record(probe, 0.1, error=False)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_probe_failure_reopens():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    fail(breaker)
+    fail(breaker)
+    clock.now = 5.0
+    breaker.record(breaker.acquire(), 0.1, error=True)
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_stale_call_does_not_settle_half_open():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    stale = breaker.acquire()
+    fail(breaker)
+    fail(breaker)
+    clock.now = 5.0
+    probe = breaker.acquire()
+    breaker.record(stale, 0.1, error=False)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+    breaker.record(probe, 0.1, error=False)
+    assert breaker.state == CircuitBreaker.CLOSED
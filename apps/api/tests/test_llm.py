@@ -0,0 +1,177 @@
+import logging
+import time
+import types
+
+import pytest
+
+from services import llm
+from services.circuit_breaker import CircuitBreaker
+
+
+class FakeAPIError(Exception):
+    pass
+
+
+class FakeAPITimeoutError(FakeAPIError):
+    pass
+
+
+class FakeClient:
+    def __init__(self, error=None, delay_s=0.0):
+        self.error = error
+        self.delay_s = delay_s
+        self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=self._create))
+
+    def with_options(self, **options):
+        return self
+
+    def _create(self, **request):
+        time.sleep(self.delay_s)
+        if self.error is not None:
+            raise self.error
+        message = types.SimpleNamespace(content="LLM explanation")
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+
+def patch_sdk_errors(monkeypatch):
+    monkeypatch.setattr(llm, "APIError", FakeAPIError)
+    monkeypatch.setattr(llm, "APITimeoutError", FakeAPITimeoutError)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(llm.LLMService, "_resolve_api_key", lambda self: None)
+    patch_sdk_errors(monkeypatch)
+    return llm.LLMService()
+
+
+def use_client(monkeypatch, service, client):
+    monkeypatch.setattr(service, "_ensure_client", lambda: client)
+
+
+def test_module_uses_installed_sdk():
+    pytest.importorskip("openai")
+    assert llm.OpenAI is not None
+    assert llm.APIError is not None
+    assert llm.APITimeoutError is not None
+
+
+def test_explain_unconfigured_falls_back_to_templates(service):
+    explanation = service.explain_decision("STEP_UP", ["GPS_LOW_ACCURACY"], {})
+    assert explanation == service.explain_from_templates("STEP_UP", ["GPS_LOW_ACCURACY"])
+    metrics = service.metrics()
+    assert metrics["degraded_responses"]["unconfigured"] == 1
+    assert metrics["circuit_breakers"]["explain"]["calls"] == 0
+
+
+def test_explain_uses_llm_when_healthy(monkeypatch, service):
+    use_client(monkeypatch, service, FakeClient())
+    assert service.explain_decision("ALLOW", ["COUNTRY_MATCH"], {}) == "LLM explanation"
+    assert service.metrics()["degraded_responses"]["total"] == 0
+
+
+def test_explain_degrades_on_timeout_and_open_circuit(monkeypatch, service):
+    use_client(monkeypatch, service, FakeClient(FakeAPITimeoutError("timed out")))
+    threshold = service.explain_breaker.failure_threshold
+    for _ in range(threshold + 1):
+        explanation = service.explain_decision("DENY", ["COUNTRY_DENIED"], {})
+        assert explanation == service.explain_from_templates("DENY", ["COUNTRY_DENIED"])
+    metrics = service.metrics()
+    assert metrics["circuit_breakers"]["explain"]["state"] == CircuitBreaker.OPEN
+    assert metrics["circuit_breakers"]["policy"]["state"] == CircuitBreaker.CLOSED
+    assert metrics["degraded_responses"]["budget_exceeded"] == threshold
+    assert metrics["degraded_responses"]["circuit_open"] == 1
+
+
+def test_explain_enforces_wall_clock_budget(monkeypatch, service):
+    service.explain_budget_s = 0.05
+    use_client(monkeypatch, service, FakeClient(delay_s=0.3))
+    started = time.monotonic()
+    explanation = service.explain_decision("ALLOW", ["COUNTRY_MATCH"], {})
+    assert time.monotonic() - started < 0.25
+    assert explanation == service.explain_from_templates("ALLOW", ["COUNTRY_MATCH"])
+    metrics = service.metrics()
+    assert metrics["degraded_responses"]["budget_exceeded"] == 1
+    assert metrics["circuit_breakers"]["explain"]["errors"] == 1
+
+
+def test_non_api_errors_do_not_trip_breaker(monkeypatch, service):
+    use_client(monkeypatch, service, FakeClient(ValueError("bad output")))
+    service.explain_decision("ALLOW", ["COUNTRY_MATCH"], {})
+    metrics = service.metrics()
+    assert metrics["degraded_responses"]["error"] == 1
+    assert metrics["circuit_breakers"]["explain"]["errors"] == 0
+
+
+def test_latency_threshold_above_budget_is_clamped(monkeypatch, caplog):
+    monkeypatch.setattr(llm.LLMService, "_resolve_api_key", lambda self: None)
+    monkeypatch.setenv("LLM_EXPLAIN_BUDGET_SECONDS", "1.0")
+    monkeypatch.setenv("LLM_EXPLAIN_BREAKER_LATENCY_THRESHOLD_SECONDS", "2.0")
+    with caplog.at_level(logging.WARNING, logger=llm.__name__):
+        service = llm.LLMService()
+    assert service.explain_breaker.latency_threshold_s == 1.0
+    assert "LLM_EXPLAIN_BREAKER_LATENCY_THRESHOLD_SECONDS" in caplog.text
+
+
+@pytest.fixture
+def api_client(monkeypatch):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from database import Base, get_db
+    from main import app
+    import models_db  # noqa: F401  (registers tables on Base)
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    TestingSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = TestingSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_attestation_uses_template_when_llm_fails(monkeypatch, api_client):
+    from api.v1.attestations import llm_service
+
+    patch_sdk_errors(monkeypatch)
+    use_client(monkeypatch, llm_service, FakeClient(FakeAPIError("upstream unavailable")))
+    errors_before = llm_service.metrics()["degraded_responses"]["error"]
+
+    response = api_client.post(
+        "/v1/attestations",
+        json={
+            "resource_id": "doc-1",
+            "gps": {"lat": 41.88, "lon": -87.63, "accuracy_m": 25, "captured_at": "2026-01-01T00:00:00Z"},
+            "client": {"user_agent": "pytest"},
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["decision"] == "ALLOW"
+    assert body["explanation_user"] == llm_service.explain_from_templates("ALLOW", body["reason_codes"])
+    assert llm_service.metrics()["degraded_responses"]["error"] == errors_before + 1
+
+
+def test_llm_metrics_endpoint(api_client):
+    response = api_client.get("/v1/ai/metrics")
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body["circuit_breakers"]) == {"explain", "policy"}
+    assert body["circuit_breakers"]["explain"]["state"] in {"CLOSED", "OPEN", "HALF_OPEN"}
+    assert {"total", "circuit_open", "budget_exceeded", "unconfigured", "error"} <= set(body["degraded_responses"])